@@ -39,6 +39,23 @@ class MenuItem(Enum):
     EXIT = 2
     RESUME_GAME = 3
 
+class ParallaxStyle(Enum):
+    STARS = 1
+    HILLS = 2
+    TOWERS = 3
+
+@dataclass
+class ParallaxLayer:
+    """Describes one scrolling layer of the arena background."""
+    style: ParallaxStyle
+    # Scroll speed relative to the obstacles' speed.
+    speed: float
+    # The layer covers the arena from this offset down to the arena bottom.
+    top_offset: int
+    # How much lighter than the background color the layer is drawn.
+    shade: int
+    seed: int
+
 @dataclass
 class GameState:
     game_settings: GameSettings = field(default_factory=lambda: GameSettings())
@@ -133,6 +150,17 @@ class GameState:
     def color_variant(self):
         return (self.human_crystals // self.crystal_change_background) % 2
 
+    # Background layers, listed from the farthest to the nearest one.
+    parallax_layers: list[ParallaxLayer] = field(default_factory=lambda: [
+        ParallaxLayer(ParallaxStyle.STARS, speed=0.1, top_offset=0, shade=60, seed=1),
+        ParallaxLayer(ParallaxStyle.HILLS, speed=0.3, top_offset=300, shade=20, seed=2),
+        ParallaxLayer(ParallaxStyle.TOWERS, speed=0.6, top_offset=380, shade=35, seed=3),
+    ])
+    # Pre-rendered wrap-around strips, indexed by color variant and then by layer.
+    background_strips: list[list[pygame.Surface]] = field(init=False)
+    # Distance travelled by the obstacles so far, used to scroll the background.
+    background_scroll: int = 0
+
     # Holds the incoming objects
     objects: list = field(default_factory=list)
     # Holds the items in the menu to be displayed
@@ -153,6 +181,21 @@ class GameState:
 
         self.obstacle_y = self.game_settings.arena_lower_y() - self.obstacle_r
 
+        strip_w = self.game_settings.arena_right_x() - self.game_settings.arena_left_x()
+        strip_h = self.game_settings.arena_lower_y() - self.game_settings.arena_upper_y()
+        strip_renderers = {
+            ParallaxStyle.STARS: sprite_utils.render_stars_strip,
+            ParallaxStyle.HILLS: sprite_utils.render_hills_strip,
+            ParallaxStyle.TOWERS: sprite_utils.render_towers_strip,
+        }
+        self.background_strips = [
+            [strip_renderers[layer.style](sprite_utils.lighten_color(color, layer.shade),
+                                          strip_w,
+                                          strip_h - layer.top_offset,
+                                          layer.seed)
+             for layer in self.parallax_layers]
+            for color in self.background_colors]
+
         self.human_sprites = sprite_utils.load_walk_right_sprite(
             output_w=self.human_image_w,
             output_h=self.human_image_h
@@ -167,5 +210,6 @@ class GameState:
         self.is_hit = False
         self.human_lives = 3
         self.human_crystals = 0
+        self.background_scroll = 0
         self.is_game_over = False
         self.human_y = self.game_settings.arena_lower_y() - self.human_h
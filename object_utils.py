@@ -101,6 +101,9 @@ def move_game_objects(state: game_data.GameState):
     # potentially to change to a new image.
     state.move_next_human_sprite()
 
+    # The background layers scroll at fractions of the obstacles' speed.
+    state.background_scroll += state.obstacle_step
+
     for obj in state.objects:
         if obj.obj_type == ObjectType.RED_BALL:
             obj.x -= state.obstacle_step
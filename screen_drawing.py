@@ -34,11 +34,28 @@ def draw_obstacle(screen: pygame.Surface,
         pygame.draw.circle(screen, circle_color, (obj.x, obj.y), obj.w // 2)
 
 
-def draw_game_objects(screen: pygame.Surface, state: game_data.GameState):
-
+def draw_background(screen: pygame.Surface, state: game_data.GameState):
     background_color = state.background_colors[state.color_variant()]
     screen.fill(background_color)
 
+    # The strips are as wide as the arena, so each layer takes at most two
+    # blits: the part right of the scroll offset, then the wrapped-around rest.
+    arena_left_x = state.game_settings.arena_left_x()
+    arena_upper_y = state.game_settings.arena_upper_y()
+    strips = state.background_strips[state.color_variant()]
+    for layer, strip in zip(state.parallax_layers, strips):
+        strip_w, strip_h = strip.get_size()
+        offset = int(state.background_scroll * layer.speed) % strip_w
+        layer_y = arena_upper_y + layer.top_offset
+        screen.blit(strip, (arena_left_x, layer_y), pygame.Rect(offset, 0, strip_w - offset, strip_h))
+        if offset:
+            screen.blit(strip, (arena_left_x + strip_w - offset, layer_y), pygame.Rect(0, 0, offset, strip_h))
+
+
+def draw_game_objects(screen: pygame.Surface, state: game_data.GameState):
+
+    draw_background(screen, state)
+
     # Write number of lives
     font = pygame.font.Font(None, 36)  # None uses the default font.
     heart_rect = screen.blit(state.heart_frame, (60, 8))
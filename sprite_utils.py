@@ -1,3 +1,6 @@
+import math
+import random
+
 import pygame
 
 def load_walk_right_sprite(output_w: int = None, output_h: int = None) -> list:
@@ -32,3 +35,57 @@ def load_frame(image_path: str, output_w: int = None, output_h: int = None) -> p
         loaded_frame = pygame.transform.scale(loaded_frame, (output_w, output_h))
 
     return loaded_frame
+
+# Color used for the transparent parts of the background strips. Colorkey
+# blits are much cheaper than per-pixel alpha ones for surfaces this large.
+STRIP_COLORKEY = (255, 0, 255)
+
+def lighten_color(color: tuple[int, int, int], amount: int) -> tuple[int, int, int]:
+    return tuple(min(255, channel + amount) for channel in color)
+
+def _new_transparent_strip(w: int, h: int) -> pygame.Surface:
+    strip = pygame.Surface((w, h))
+    strip.fill(STRIP_COLORKEY)
+    strip.set_colorkey(STRIP_COLORKEY, pygame.RLEACCEL)
+    return strip
+
+# The strips below wrap around horizontally: whatever is drawn past the right
+# edge continues from the left edge, so they can be scrolled endlessly.
+
+def render_stars_strip(color: tuple[int, int, int], w: int, h: int, seed: int) -> pygame.Surface:
+    rng = random.Random(seed)
+    strip = _new_transparent_strip(w, h)
+    for _ in range(w * h // 4000):
+        x = rng.randrange(w)
+        y = rng.randrange(h)
+        size = rng.choice([1, 1, 2, 3])
+        strip.fill(color, pygame.Rect(x, y, size, size))
+    return strip
+
+def render_hills_strip(color: tuple[int, int, int], w: int, h: int, seed: int) -> pygame.Surface:
+    rng = random.Random(seed)
+    strip = _new_transparent_strip(w, h)
+    # Whole numbers of periods over the strip width keep both edges matching.
+    waves = [(rng.randint(1, 4), rng.uniform(0, 2 * math.pi), rng.uniform(0.05, 0.15) * h)
+             for _ in range(3)]
+    base_y = h // 3
+    points = [(0, h)]
+    for x in list(range(0, w, 10)) + [w]:
+        y = base_y + sum(amplitude * math.sin(2 * math.pi * periods * x / w + phase)
+                         for periods, phase, amplitude in waves)
+        points.append((x, int(y)))
+    points.append((w, h))
+    pygame.draw.polygon(strip, color, points)
+    return strip
+
+def render_towers_strip(color: tuple[int, int, int], w: int, h: int, seed: int) -> pygame.Surface:
+    rng = random.Random(seed)
+    strip = _new_transparent_strip(w, h)
+    x = 0
+    while x < w:
+        tower_w = rng.randint(30, 80)
+        tower_h = rng.randint(h // 4, h * 3 // 4)
+        for shift in (0, -w):
+            strip.fill(color, pygame.Rect(x + shift, h - tower_h, tower_w, tower_h))
+        x += tower_w + rng.randint(20, 120)
+    return strip